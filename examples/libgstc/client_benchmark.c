@@ -0,0 +1,142 @@
+/*
+ * GStreamer Daemon - gst-launch on steroids
+ * C client library abstracting gstd interprocess communication
+ *
+ * Copyright (c) 2015-2018 RidgeRun, LLC (http://www.ridgerun.com)
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions
+ * are met:
+ *
+ * 1. Redistributions of source code must retain the above copyright
+ * notice, this list of conditions and the following disclaimer.
+ *
+ * 2. Redistributions in binary form must reproduce the above
+ * copyright notice, this list of conditions and the following
+ * disclaimer in the documentation and/or other materials provided
+ * with the distribution.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ * "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ * LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+ * FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+ * COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT,
+ * INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+ * (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+ * SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION)
+ * HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT,
+ * STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+ * ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED
+ * OF THE POSSIBILITY OF SUCH DAMAGE.
+ */
+
+/*
+ * Round-trip micro benchmark for the client library. Hammers the
+ * daemon with pings and pipeline listings over the requested transport
+ * and reports usecs/op and ops/sec, so transport or protocol changes
+ * can be compared with numbers rather than intuition.
+ *
+ * Usage: client_benchmark [address] [port] [iterations]
+ *
+ * An address starting with '/' selects a Unix socket, the port is then
+ * ignored. Pass 0 as port to keep the default.
+ */
+
+#include <stdio.h>
+#include <stdlib.h>
+#include <time.h>
+
+#include "libgstc.h"
+
+static long long
+time_now_us (void)
+{
+  struct timespec ts;
+
+  clock_gettime (CLOCK_MONOTONIC, &ts);
+
+  return ts.tv_sec * 1000000LL + ts.tv_nsec / 1000;
+}
+
+static void
+report (const char *name, const long long elapsed_us, const int iterations)
+{
+  printf ("%-16s %10d ops in %8.3f s: %10.3f usecs/op %12.0f ops/sec\n",
+      name, iterations, elapsed_us / 1000000.0,
+      (double) elapsed_us / iterations,
+      iterations / (elapsed_us / 1000000.0));
+}
+
+int
+main (int argc, char *argv[])
+{
+  GstClient *client;
+  GstcStatus ret;
+  const char *address = "127.0.0.1";
+  unsigned int port = 5000;
+  const long wait_time = -1;
+  const int keep_open = 1;
+  int iterations = 10000;
+  long long start;
+  long long elapsed;
+  int i;
+
+  if (argc > 1) {
+    address = argv[1];
+  }
+  if (argc > 2 && atoi (argv[2]) > 0) {
+    port = atoi (argv[2]);
+  }
+  if (argc > 3 && atoi (argv[3]) > 0) {
+    iterations = atoi (argv[3]);
+  }
+
+  ret = gstc_client_new (address, port, wait_time, keep_open, &client);
+  if (GSTC_OK != ret) {
+    fprintf (stderr, "There was a problem creating a GstClient: %d\n", ret);
+    goto out;
+  }
+
+  ret = gstc_client_ping (client);
+  if (GSTC_OK != ret) {
+    fprintf (stderr, "Unable to contact server: %d\n", ret);
+    goto free_client;
+  }
+
+  start = time_now_us ();
+  for (i = 0; i < iterations; i++) {
+    ret = gstc_client_ping (client);
+    if (GSTC_OK != ret) {
+      fprintf (stderr, "Ping failed after %d iterations: %d\n", i, ret);
+      goto free_client;
+    }
+  }
+  elapsed = time_now_us () - start;
+  report ("ping", elapsed, iterations);
+
+  start = time_now_us ();
+  for (i = 0; i < iterations; i++) {
+    char **pipelines;
+    int count;
+    int j;
+
+    ret = gstc_pipeline_list (client, &pipelines, &count);
+    if (GSTC_OK != ret) {
+      fprintf (stderr, "Listing failed after %d iterations: %d\n", i, ret);
+      goto free_client;
+    }
+
+    for (j = 0; j < count; j++) {
+      free (pipelines[j]);
+    }
+    free (pipelines);
+  }
+  elapsed = time_now_us () - start;
+  report ("pipeline_list", elapsed, iterations);
+
+free_client:
+  gstc_client_free (client);
+
+out:
+  return ret;
+}
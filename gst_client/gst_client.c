@@ -381,9 +381,6 @@ main (gint argc, gchar * argv[])
     return EXIT_SUCCESS;
   }
 
-  init_readline ();
-  read_history (history_full);
-
   data = (GstdClientData *) g_malloc (sizeof (GstdClientData));
   data->quiet = quiet;
   data->prompt = prompt;
@@ -418,6 +415,11 @@ main (gint argc, gchar * argv[])
   quit = TRUE;
 #endif
 
+  /* Only interactive sessions need readline and the history file,
+     one-shot commands skip the setup entirely */
+  init_readline ();
+  read_history (history_full);
+
   gstd_client_header (quiet);
 
   /* New interrupt checkpoint */
@@ -563,7 +565,8 @@ gstd_client_cmd_socket (gchar * name, gchar * arg, GstdClientData * data)
   GInputStream *istream;
   GOutputStream *ostream;
   gchar buffer[1024 * 1024];
-  gint read;
+  gssize read;
+  gsize total = 0;
   gchar * path_name;
 
   g_return_val_if_fail (name, -1);
@@ -606,18 +609,37 @@ gstd_client_cmd_socket (gchar * name, gchar * arg, GstdClientData * data)
   //Paranoia flush
   g_output_stream_flush (ostream, NULL, NULL);
 
-  read = g_input_stream_read (istream, &buffer, sizeof (buffer), NULL, &err);
-  if (err)
-    goto error;
+  /* Responses are NUL framed; with the connection reused across
+     commands, keep reading until the terminator so a reply split over
+     several segments doesn't bleed into the next command's output */
+  while (TRUE) {
+    read = g_input_stream_read (istream, buffer + total,
+        sizeof (buffer) - 1 - total, NULL, &err);
+    if (err)
+      goto error;
+
+    /* The daemon dropped the connection, retire it so the next command
+       opens a fresh one */
+    if (0 == read) {
+      g_object_unref (data->con);
+      data->con = NULL;
+      break;
+    }
+
+    if (memchr (buffer + total, '\0', read)) {
+      total += read;
+      break;
+    }
+
+    total += read;
+    if (total >= sizeof (buffer) - 1)
+      break;
+  }
 
   //Make sure it has its sentinel and print
-  buffer[read] = '\0';
+  buffer[total] = '\0';
   g_print ("%s\n", buffer);
 
-  // FIXME: Hack to open a new connection with every message
-  g_object_unref (data->con);
-  data->con = NULL;
-
   return 0;
 
 error:
@@ -41,6 +41,9 @@ static GstdReturnCode gstd_parser_delete (GstdSession * session,
     GstdObject * obj, gchar * args, gchar ** response);
 static GstdReturnCode gstd_parser_parse_raw_cmd (GstdSession * session,
     gchar * action, gchar * args, gchar ** response);
+static GstdReturnCode gstd_parser_fmt_raw_cmd (GstdSession * session,
+    const gchar * action, const gchar * fmt, const gchar * arg,
+    gchar ** response);
 static GstdReturnCode gstd_parser_pipeline_create (GstdSession *, gchar *,
     gchar *, gchar **);
 static GstdReturnCode gstd_parser_pipeline_delete (GstdSession *, gchar *,
@@ -215,14 +218,34 @@ gstd_parser_parse_cmd (GstdSession * session, const gchar * cmd, gchar ** respon
     cb++;
   }
 
-  if (ret == GSTD_BAD_COMMAND)
+  /* Only complain when no entry matched, callbacks already report
+     their own errors */
+  if (NULL == cb->cmd)
     GST_ERROR_OBJECT (session, "Unknown command \"%s\"", action);
   g_strfreev (tokens);
 
   return ret;
 }
 
+/* Shared body of the simple command aliases: format a one-argument
+   resource URI and forward it as a raw command */
+static GstdReturnCode
+gstd_parser_fmt_raw_cmd (GstdSession * session, const gchar * action,
+    const gchar * fmt, const gchar * arg, gchar ** response)
+{
+  GstdReturnCode ret;
+  gchar *uri;
+
+  g_return_val_if_fail (GSTD_IS_SESSION (session), GSTD_NULL_ARGUMENT);
+  g_return_val_if_fail (arg, GSTD_NULL_ARGUMENT);
+  g_return_val_if_fail (response, GSTD_NULL_ARGUMENT);
+
+  uri = g_strdup_printf (fmt, arg);
+  ret = gstd_parser_parse_raw_cmd (session, (gchar *) action, uri, response);
+  g_free (uri);
 
+  return ret;
+}
 
 static GstdReturnCode
 gstd_parser_create (GstdSession * session, GstdObject * obj, gchar * args,
@@ -353,68 +376,32 @@ static GstdReturnCode
 gstd_parser_pipeline_delete (GstdSession * session, gchar * action, gchar * args,
     gchar ** response)
 {
-  GstdReturnCode ret;
-  gchar *uri;
-
-  g_return_val_if_fail (GSTD_IS_SESSION (session), GSTD_NULL_ARGUMENT);
-  g_return_val_if_fail (args, GSTD_NULL_ARGUMENT);
-
-  uri = g_strdup_printf ("/pipelines %s", args);
-  ret = gstd_parser_parse_raw_cmd (session, (gchar*)"delete", uri, response);
-  g_free (uri);
-
-  return ret;
+  return gstd_parser_fmt_raw_cmd (session, "delete", "/pipelines %s", args,
+      response);
 }
 
 static GstdReturnCode
 gstd_parser_pipeline_play (GstdSession * session, gchar * action, gchar * args,
     gchar ** response)
 {
-  GstdReturnCode ret;
-  gchar *uri;
-
-  g_return_val_if_fail (GSTD_IS_SESSION (session), GSTD_NULL_ARGUMENT);
-  g_return_val_if_fail (args, GSTD_NULL_ARGUMENT);
-
-  uri = g_strdup_printf ("/pipelines/%s/state playing", args);
-  ret = gstd_parser_parse_raw_cmd (session, (gchar*)"update", uri, response);
-  g_free (uri);
-
-  return ret;
+  return gstd_parser_fmt_raw_cmd (session, "update", "/pipelines/%s/state playing",
+      args, response);
 }
 
 static GstdReturnCode
 gstd_parser_pipeline_pause (GstdSession * session, gchar * action, gchar * args,
     gchar ** response)
 {
-  GstdReturnCode ret;
-  gchar *uri;
-
-  g_return_val_if_fail (GSTD_IS_SESSION (session), GSTD_NULL_ARGUMENT);
-  g_return_val_if_fail (args, GSTD_NULL_ARGUMENT);
-
-  uri = g_strdup_printf ("/pipelines/%s/state paused", args);
-  ret = gstd_parser_parse_raw_cmd (session, (gchar*)"update", uri, response);
-  g_free (uri);
-
-  return ret;
+  return gstd_parser_fmt_raw_cmd (session, "update", "/pipelines/%s/state paused",
+      args, response);
 }
 
 static GstdReturnCode
 gstd_parser_pipeline_stop (GstdSession * session, gchar * action, gchar * args,
     gchar ** response)
 {
-  GstdReturnCode ret;
-  gchar *uri;
-
-  g_return_val_if_fail (GSTD_IS_SESSION (session), GSTD_NULL_ARGUMENT);
-  g_return_val_if_fail (args, GSTD_NULL_ARGUMENT);
-
-  uri = g_strdup_printf ("/pipelines/%s/state null", args);
-  ret = gstd_parser_parse_raw_cmd (session, (gchar*)"update", uri, response);
-  g_free (uri);
-
-  return ret;
+  return gstd_parser_fmt_raw_cmd (session, "update", "/pipelines/%s/state null",
+      args, response);
 }
 
 static GstdReturnCode
@@ -474,33 +461,18 @@ static GstdReturnCode
 gstd_parser_list_pipelines (GstdSession * session, gchar * action, gchar * args,
     gchar ** response)
 {
-  GstdReturnCode ret;
-  gchar *uri;
-
   g_return_val_if_fail (GSTD_IS_SESSION (session), GSTD_NULL_ARGUMENT);
 
-  uri = g_strdup_printf ("/pipelines");
-  ret = gstd_parser_parse_raw_cmd (session, (gchar*)"read", uri, response);
-  g_free (uri);
-
-  return ret;
+  return gstd_parser_parse_raw_cmd (session, (gchar *) "read",
+      (gchar *) "/pipelines", response);
 }
 
 static GstdReturnCode
 gstd_parser_list_elements (GstdSession * session, gchar * action, gchar * args,
     gchar ** response)
 {
-  GstdReturnCode ret;
-  gchar *uri;
-
-  g_return_val_if_fail (GSTD_IS_SESSION (session), GSTD_NULL_ARGUMENT);
-  g_return_val_if_fail (args, GSTD_NULL_ARGUMENT);
-
-  uri = g_strdup_printf ("/pipelines/%s/elements/", args);
-  ret = gstd_parser_parse_raw_cmd (session, (gchar*)"read", uri, response);
-  g_free (uri);
-
-  return ret;
+  return gstd_parser_fmt_raw_cmd (session, "read", "/pipelines/%s/elements/",
+      args, response);
 }
 
 static GstdReturnCode
@@ -559,19 +531,8 @@ static GstdReturnCode
 gstd_parser_bus_read (GstdSession * session, gchar * action,
     gchar * pipeline, gchar ** response)
 {
-  GstdReturnCode ret;
-  gchar *uri;
-
-  g_return_val_if_fail (GSTD_IS_SESSION (session), GSTD_NULL_ARGUMENT);
-  g_return_val_if_fail (pipeline, GSTD_NULL_ARGUMENT);
-  g_return_val_if_fail (response, GSTD_NULL_ARGUMENT);
-
-  uri = g_strdup_printf ("/pipelines/%s/bus/message", pipeline);
-  ret = gstd_parser_parse_raw_cmd (session, (gchar*)"read", uri, response);
-
-  g_free (uri);
-
-  return ret;
+  return gstd_parser_fmt_raw_cmd (session, "read", "/pipelines/%s/bus/message",
+      pipeline, response);
 }
 
 static GstdReturnCode
@@ -628,19 +589,8 @@ static GstdReturnCode
 gstd_parser_event_eos (GstdSession * session, gchar * action, gchar * pipeline,
     gchar ** response)
 {
-  GstdReturnCode ret;
-  gchar *uri;
-
-  g_return_val_if_fail (GSTD_IS_SESSION (session), GSTD_NULL_ARGUMENT);
-  g_return_val_if_fail (pipeline, GSTD_NULL_ARGUMENT);
-  g_return_val_if_fail (response, GSTD_NULL_ARGUMENT);
-
-  uri = g_strdup_printf ("/pipelines/%s/event eos", pipeline);
-  ret = gstd_parser_parse_raw_cmd (session, (gchar*)"create", uri, response);
-
-  g_free (uri);
-
-  return ret;
+  return gstd_parser_fmt_raw_cmd (session, "create", "/pipelines/%s/event eos",
+      pipeline, response);
 }
 
 static GstdReturnCode
@@ -672,19 +622,8 @@ static GstdReturnCode
 gstd_parser_event_flush_start (GstdSession * session, gchar * action,
     gchar * pipeline, gchar ** response)
 {
-  GstdReturnCode ret;
-  gchar *uri;
-
-  g_return_val_if_fail (GSTD_IS_SESSION (session), GSTD_NULL_ARGUMENT);
-  g_return_val_if_fail (pipeline, GSTD_NULL_ARGUMENT);
-  g_return_val_if_fail (response, GSTD_NULL_ARGUMENT);
-
-  uri = g_strdup_printf ("/pipelines/%s/event flush_start", pipeline);
-  ret = gstd_parser_parse_raw_cmd (session, (gchar*)"create", uri, response);
-
-  g_free (uri);
-
-  return ret;
+  return gstd_parser_fmt_raw_cmd (session, "create",
+      "/pipelines/%s/event flush_start", pipeline, response);
 }
 
 static GstdReturnCode
@@ -718,60 +657,30 @@ static GstdReturnCode
 gstd_parser_debug_enable (GstdSession * session, gchar * action, gchar * enabled,
     gchar ** response)
 {
-  GstdReturnCode ret;
-  gchar *uri;
-
-  g_return_val_if_fail (GSTD_IS_SESSION (session), GSTD_NULL_ARGUMENT);
-  g_return_val_if_fail (response, GSTD_NULL_ARGUMENT);
-
   check_argument (enabled, GSTD_BAD_COMMAND);
 
-  uri = g_strdup_printf ("/debug/enable %s", enabled);
-  ret = gstd_parser_parse_raw_cmd (session, (gchar*)"update", uri, response);
-
-  g_free (uri);
-
-  return ret;
+  return gstd_parser_fmt_raw_cmd (session, "update", "/debug/enable %s",
+      enabled, response);
 }
 
 static GstdReturnCode
 gstd_parser_debug_threshold (GstdSession * session, gchar * action,
     gchar * threshold, gchar ** response)
 {
-  GstdReturnCode ret;
-  gchar *uri;
-
-  g_return_val_if_fail (GSTD_IS_SESSION (session), GSTD_NULL_ARGUMENT);
-  g_return_val_if_fail (response, GSTD_NULL_ARGUMENT);
-
   check_argument (threshold, GSTD_BAD_COMMAND);
 
-  uri = g_strdup_printf ("/debug/threshold %s", threshold);
-  ret = gstd_parser_parse_raw_cmd (session, (gchar*)"update", uri, response);
-
-  g_free (uri);
-
-  return ret;
+  return gstd_parser_fmt_raw_cmd (session, "update", "/debug/threshold %s",
+      threshold, response);
 }
 
 static GstdReturnCode
 gstd_parser_debug_color (GstdSession * session, gchar * action, gchar * colored,
     gchar ** response)
 {
-  GstdReturnCode ret;
-  gchar *uri;
-
-  g_return_val_if_fail (GSTD_IS_SESSION (session), GSTD_NULL_ARGUMENT);
-  g_return_val_if_fail (response, GSTD_NULL_ARGUMENT);
-
   check_argument (colored, GSTD_BAD_COMMAND);
 
-  uri = g_strdup_printf ("/debug/color %s", colored);
-  ret = gstd_parser_parse_raw_cmd (session, (gchar*)"update", uri, response);
-
-  g_free (uri);
-
-  return ret;
+  return gstd_parser_fmt_raw_cmd (session, "update", "/debug/color %s",
+      colored, response);
 }
 
 
@@ -779,20 +688,10 @@ static GstdReturnCode
 gstd_parser_debug_reset (GstdSession * session, gchar * action, gchar * reset,
     gchar ** response)
 {
-  GstdReturnCode ret;
-  gchar *uri;
-
-  g_return_val_if_fail (GSTD_IS_SESSION (session), GSTD_NULL_ARGUMENT);
-  g_return_val_if_fail (response, GSTD_NULL_ARGUMENT);
-
   check_argument (reset, GSTD_BAD_COMMAND);
 
-  uri = g_strdup_printf ("/debug/reset %s", reset);
-  ret = gstd_parser_parse_raw_cmd (session, (gchar*)"update", uri, response);
-
-  g_free (uri);
-
-  return ret;
+  return gstd_parser_fmt_raw_cmd (session, "update", "/debug/reset %s",
+      reset, response);
 }
 
 
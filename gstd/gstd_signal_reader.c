@@ -210,10 +210,12 @@ gstd_signal_marshal (GClosure * closure, GValue * return_value,
 {
   GstdSignalReader *self = GSTD_SIGNAL_READER (closure->data);
 
+  /* The reader consumes the callback under the same lock, publishing it
+     outside would race against a concurrent disconnect or timeout */
+  g_mutex_lock (&self->signal_lock);
   self->callback =
       gstd_callback_new (GSTD_OBJECT_NAME (self->target), return_value,
       n_param_values, param_values);
-  g_mutex_lock (&self->signal_lock);
   self->waiting_signal = FALSE;
   g_cond_signal (&self->signal_call);
   g_mutex_unlock (&self->signal_lock);
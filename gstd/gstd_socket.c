@@ -92,6 +92,7 @@ gstd_socket_callback (GSocketService * service,
   gchar *output = NULL;
   gchar *response;
   gchar *message;
+  const gchar *cmd;
   GstdReturnCode ret;
   const gchar *description = NULL;
 
@@ -108,7 +109,8 @@ gstd_socket_callback (GSocketService * service,
   message = g_malloc (size);
 
   while (TRUE) {
-    read = g_input_stream_read (istream, message, size, NULL, NULL);
+    /* Leave room for the terminator in case the client didn't send one */
+    read = g_input_stream_read (istream, message, size - 1, NULL, NULL);
 
     /* Was connection closed? */
     if (read <= 0) {
@@ -116,24 +118,33 @@ gstd_socket_callback (GSocketService * service,
     }
     message[read] = '\0';
 
-    ret = gstd_parser_parse_cmd (session, message, &output); // in the parser
-
-    /* Prepend the code to the output */
-    description = gstd_return_code_to_string (ret);
-    response =
-      g_strdup_printf
-      ("{\n  \"code\" : %d,\n  \"description\" : \"%s\",\n  \"response\" : %s\n}",
-       ret, description, output ? output : "null");
-    g_free (output);
-    output = NULL;
-
-    read = g_output_stream_write (ostream, response, strlen (response) + 1, NULL, NULL);
-    if (read < 0) {
-      break;
+    /* A pipelining client may have sent several NUL separated commands
+       back to back, answer each one in order */
+    cmd = message;
+    while (cmd < message + read) {
+      ret = gstd_parser_parse_cmd (session, cmd, &output); // in the parser
+
+      /* Prepend the code to the output */
+      description = gstd_return_code_to_string (ret);
+      response =
+        g_strdup_printf
+        ("{\n  \"code\" : %d,\n  \"description\" : \"%s\",\n  \"response\" : %s\n}",
+         ret, description, output ? output : "null");
+      g_free (output);
+      output = NULL;
+
+      if (g_output_stream_write (ostream, response, strlen (response) + 1,
+              NULL, NULL) < 0) {
+        g_free (response);
+        goto close;
+      }
+      g_free (response);
+
+      cmd += strlen (cmd) + 1;
     }
-    g_free (response);
   }
 
+close:
   g_free (message);
 
   return TRUE;
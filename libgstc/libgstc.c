@@ -79,16 +79,22 @@ static GstcStatus gstc_cmd_delete (GstClient * client, const char *where,
 static GstcStatus gstc_cmd_change_state (GstClient * client, const char *pipe,
     const char *state);
 static GstcStatus gstc_response_get_code (const char *response, int *code);
+static void gstc_client_cache_invalidate (GstClient * client);
 static void *gstc_bus_thread (void *user_data);
-static GstcStatus
-gstc_pipeline_bus_wait_callback (GstClient * _client, const char *pipeline_name,
-    const char *message_name, const long long timeout, char *message,
-    void *user_data);
-
+static GstcStatus gstc_cmd_bus_arm (GstClient * client,
+    const char *pipeline_name, const char *message_name,
+    const long long timeout);
+static void *gstc_batch_thread (void *user_data);
 struct _GstClient
 {
   GstcSocket *socket;
   int timeout;
+  int use_read_cache;
+  char *pipelines_cache;
+
+  /* Protects the cached response from concurrent readers and the
+     invalidations issued by asynchronous batches */
+  GstcMutex cache_mutex;
 };
 
 typedef struct _GstcThreadData GstcThreadData;
@@ -102,14 +108,15 @@ struct _GstcThreadData
   long long timeout;
 };
 
-typedef struct _GstcSyncBusData GstcSyncBusData;
-struct _GstcSyncBusData
+typedef struct _GstcBatchData GstcBatchData;
+struct _GstcBatchData
 {
-  GstcCond cond;
-  GstcMutex mutex;
-  int waiting;
-  char *message;
-  GstcStatus ret;
+  GstClient *client;
+  const char **requests;
+  int num_requests;
+  GstcStatus *codes;
+  GstcBatchCallback func;
+  void *user_data;
 };
 
 static GstcStatus
@@ -282,6 +289,9 @@ gstc_client_new (const char *address, const unsigned int port,
   }
 
   client->timeout = wait_time;
+  client->use_read_cache = 0;
+  client->pipelines_cache = NULL;
+  gstc_mutex_init (&(client->cache_mutex));
 
   ret =
       gstc_socket_new (address, port, keep_connection_open, &(client->socket));
@@ -295,6 +305,33 @@ gstc_client_new (const char *address, const unsigned int port,
   return ret;
 }
 
+/* Drop any response cached from a previous read, called whenever a
+   mutating command may have changed what the daemon would answer */
+static void
+gstc_client_cache_invalidate (GstClient * client)
+{
+  gstc_mutex_lock (&(client->cache_mutex));
+  free (client->pipelines_cache);
+  client->pipelines_cache = NULL;
+  gstc_mutex_unlock (&(client->cache_mutex));
+}
+
+GstcStatus
+gstc_client_enable_read_cache (GstClient * client, const int enable)
+{
+  gstc_assert_and_ret_val (NULL != client, GSTC_NULL_ARGUMENT);
+
+  gstc_mutex_lock (&(client->cache_mutex));
+  client->use_read_cache = enable;
+  gstc_mutex_unlock (&(client->cache_mutex));
+
+  if (!enable) {
+    gstc_client_cache_invalidate (client);
+  }
+
+  return GSTC_OK;
+}
+
 GstcStatus
 gstc_pipeline_create (GstClient * client, const char *pipeline_name,
     const char *pipeline_desc)
@@ -316,6 +353,7 @@ gstc_pipeline_create (GstClient * client, const char *pipeline_name,
   }
 
   ret = gstc_cmd_create (client, resource, create_args);
+  gstc_client_cache_invalidate (client);
 
   free (create_args);
 
@@ -332,6 +370,7 @@ gstc_pipeline_delete (GstClient * client, const char *pipeline_name)
   gstc_assert_and_ret_val (NULL != pipeline_name, GSTC_NULL_ARGUMENT);
 
   ret = gstc_cmd_delete (client, resource, pipeline_name);
+  gstc_client_cache_invalidate (client);
 
   return ret;
 }
@@ -342,11 +381,21 @@ gstc_cmd_change_state (GstClient * client, const char *pipe, const char *state)
   GstcStatus ret;
   int asprintf_ret;
   char *resource;
+  char request[128];
+  int request_len;
 
   gstc_assert_and_ret_val (NULL != client, GSTC_NULL_ARGUMENT);
   gstc_assert_and_ret_val (NULL != pipe, GSTC_NULL_ARGUMENT);
   gstc_assert_and_ret_val (NULL != state, GSTC_NULL_ARGUMENT);
 
+  /* State changes are the hottest command, build the request on the
+     stack when it fits and skip the two heap allocations */
+  request_len = snprintf (request, sizeof (request),
+      "update " PIPELINE_STATE_FORMAT " %s", pipe, state);
+  if (request_len > 0 && (size_t) request_len < sizeof (request)) {
+    return gstc_cmd_send (client, request);
+  }
+
   asprintf_ret = asprintf (&resource, PIPELINE_STATE_FORMAT, pipe);
   if (asprintf_ret == PRINTF_ERROR) {
     return GSTC_OOM;
@@ -392,11 +441,34 @@ gstc_pipeline_stop (GstClient * client, const char *pipeline_name)
   return gstc_cmd_change_state (client, pipeline_name, state);
 }
 
+GstcStatus
+gstc_pipeline_teardown (GstClient * client, const char *pipeline_name)
+{
+  GstcStatus ret;
+  const char *state = "null";
+  const char *resource = "/pipelines";
+
+  gstc_assert_and_ret_val (NULL != client, GSTC_NULL_ARGUMENT);
+  gstc_assert_and_ret_val (NULL != pipeline_name, GSTC_NULL_ARGUMENT);
+
+  /* Stop before deleting so resources are released in order */
+  ret = gstc_cmd_change_state (client, pipeline_name, state);
+  if (GSTC_OK != ret) {
+    return ret;
+  }
+
+  ret = gstc_cmd_delete (client, resource, pipeline_name);
+  gstc_client_cache_invalidate (client);
+
+  return ret;
+}
+
 void
 gstc_client_free (GstClient * client)
 {
   gstc_assert_and_ret (NULL != client);
 
+  gstc_client_cache_invalidate (client);
   gstc_socket_free (client->socket);
   free (client);
 }
@@ -411,6 +483,115 @@ gstc_client_ping (GstClient * client)
   return gstc_cmd_send (client, request);
 }
 
+GstcStatus
+gstc_client_batch (GstClient * client, const char *requests[],
+    const int num_requests, GstcStatus codes[])
+{
+  GstcStatus ret = GSTC_OK;
+  char *response;
+  int i;
+
+  gstc_assert_and_ret_val (NULL != client, GSTC_NULL_ARGUMENT);
+  gstc_assert_and_ret_val (NULL != requests, GSTC_NULL_ARGUMENT);
+  gstc_assert_and_ret_val (NULL != codes, GSTC_NULL_ARGUMENT);
+
+  for (i = 0; i < num_requests; i++) {
+    gstc_assert_and_ret_val (NULL != requests[i], GSTC_NULL_ARGUMENT);
+
+    response = NULL;
+    codes[i] = gstc_cmd_send_get_response (client, requests[i], &response,
+        client->timeout);
+    free (response);
+
+    /* Report the first failure, but keep going so every entry in
+       codes gets filled */
+    if (GSTC_OK != codes[i] && GSTC_OK == ret) {
+      ret = codes[i];
+    }
+  }
+
+  /* Raw requests may mutate anything, drop any cached response */
+  gstc_client_cache_invalidate (client);
+
+  return ret;
+}
+
+GstcStatus
+gstc_client_batch_full (GstClient * client, const char *requests[],
+    const int num_requests, GstcStatus codes[], char *responses[])
+{
+  GstcStatus ret = GSTC_OK;
+  int i;
+
+  gstc_assert_and_ret_val (NULL != client, GSTC_NULL_ARGUMENT);
+  gstc_assert_and_ret_val (NULL != requests, GSTC_NULL_ARGUMENT);
+  gstc_assert_and_ret_val (NULL != codes, GSTC_NULL_ARGUMENT);
+  gstc_assert_and_ret_val (NULL != responses, GSTC_NULL_ARGUMENT);
+
+  for (i = 0; i < num_requests; i++) {
+    gstc_assert_and_ret_val (NULL != requests[i], GSTC_NULL_ARGUMENT);
+
+    responses[i] = NULL;
+    codes[i] = gstc_cmd_send_get_response (client, requests[i],
+        &(responses[i]), client->timeout);
+
+    /* Report the first failure, but keep going so every entry in
+       codes and responses gets filled */
+    if (GSTC_OK != codes[i] && GSTC_OK == ret) {
+      ret = codes[i];
+    }
+  }
+
+  /* Raw requests may mutate anything, drop any cached response */
+  gstc_client_cache_invalidate (client);
+
+  return ret;
+}
+
+static void *
+gstc_batch_thread (void *user_data)
+{
+  GstcBatchData *data = (GstcBatchData *) user_data;
+  GstcStatus ret;
+
+  ret = gstc_client_batch (data->client, data->requests, data->num_requests,
+      data->codes);
+  data->func (data->client, data->requests, data->num_requests, data->codes,
+      ret, data->user_data);
+
+  free (data);
+
+  return NULL;
+}
+
+GstcStatus
+gstc_client_batch_async (GstClient * client, const char *requests[],
+    const int num_requests, GstcStatus codes[], GstcBatchCallback callback,
+    void *user_data)
+{
+  GstcBatchData *data;
+  GstcThread thread;
+
+  gstc_assert_and_ret_val (NULL != client, GSTC_NULL_ARGUMENT);
+  gstc_assert_and_ret_val (NULL != requests, GSTC_NULL_ARGUMENT);
+  gstc_assert_and_ret_val (NULL != codes, GSTC_NULL_ARGUMENT);
+  gstc_assert_and_ret_val (NULL != callback, GSTC_NULL_ARGUMENT);
+
+  data = malloc (sizeof (GstcBatchData));
+  if (NULL == data) {
+    return GSTC_OOM;
+  }
+
+  data->client = client;
+  data->requests = requests;
+  data->num_requests = num_requests;
+  data->codes = codes;
+  data->func = callback;
+  data->user_data = user_data;
+
+  return gstc_thread_new (&thread, gstc_batch_thread, data);
+}
+
 GstcStatus
 gstc_client_debug (GstClient * client, const char *threshold,
     const int colors, const int reset)
@@ -422,8 +603,9 @@ gstc_client_debug (GstClient * client, const char *threshold,
   gstc_assert_and_ret_val (NULL != client, GSTC_NULL_ARGUMENT);
   gstc_assert_and_ret_val (NULL != threshold, GSTC_NULL_ARGUMENT);
 
-  /* Enable debug of the pipeline */
-  ret = gstc_cmd_update (client, "/debug/enable", "true");
+  /* Enable debug of the pipeline. The boolean requests only have two
+     possible forms, send them as literals instead of formatting them */
+  ret = gstc_cmd_send (client, "update /debug/enable true");
   if (ret != GSTC_OK) {
     return ret;
   }
@@ -435,15 +617,17 @@ gstc_client_debug (GstClient * client, const char *threshold,
   }
 
   /* Enable the color in debug */
-  colored = colors == 0 ? "false" : "true";
-  ret = gstc_cmd_update (client, "/debug/color", colored);
+  colored = colors == 0 ? "update /debug/color false"
+      : "update /debug/color true";
+  ret = gstc_cmd_send (client, colored);
   if (ret != GSTC_OK) {
     return ret;
   }
 
   /* Set debug threshold reset */
-  reset_bool = reset == 0 ? "false" : "true";
-  ret = gstc_cmd_update (client, "/debug/reset", reset_bool);
+  reset_bool = reset == 0 ? "update /debug/reset false"
+      : "update /debug/reset true";
+  ret = gstc_cmd_send (client, reset_bool);
 
   if (ret != GSTC_OK) {
     return ret;
@@ -745,15 +929,13 @@ gstc_bus_thread (void *user_data)
   return NULL;
 }
 
-GstcStatus
-gstc_pipeline_bus_wait_async (GstClient * client,
-    const char *pipeline_name, const char *message_name,
-    const long long timeout, GstcPipelineBusWaitCallback callback,
-    void *user_data)
+/* Configure the message types and timeout of the pipeline's bus before
+   reading from it */
+static GstcStatus
+gstc_cmd_bus_arm (GstClient * client, const char *pipeline_name,
+    const char *message_name, const long long timeout)
 {
   int asprintf_ret;
-  GstcThreadData *data;
-  GstcThread thread;
   char *where_timeout;
   char *where_types;
   char *how_timeout;
@@ -785,15 +967,6 @@ gstc_pipeline_bus_wait_async (GstClient * client,
   gstc_cmd_update (client, where_types, message_name);
   gstc_cmd_update (client, where_timeout, how_timeout);
 
-  data = malloc (sizeof (GstcThreadData));
-  data->client = client;
-  data->pipeline_name = pipeline_name;
-  data->message = message_name;
-  data->func = callback;
-  data->user_data = user_data;
-  data->timeout = timeout;
-  ret = gstc_thread_new (&thread, gstc_bus_thread, data);
-
   free (where_types);
 
 free_how:
@@ -806,93 +979,147 @@ out:
   return ret;
 }
 
-/*
- * The Wunused-parameter warning is ignored for this function since it should
- * carry all of this information for the callback even when the parameters
- * aren't directly used
- */
-#pragma GCC diagnostic ignored "-Wunused-parameter"
-static GstcStatus
-gstc_pipeline_bus_wait_callback (GstClient * _client, const char *pipeline_name,
-    const char *message_name, const long long timeout, char *message,
+GstcStatus
+gstc_pipeline_bus_wait_async (GstClient * client,
+    const char *pipeline_name, const char *message_name,
+    const long long timeout, GstcPipelineBusWaitCallback callback,
     void *user_data)
 {
-  GstcSyncBusData *data = (GstcSyncBusData *) user_data;
-  GstcStatus ret = GSTC_OK;
-  const int msglen = strlen (message) + 1;
-  const char *response_tag = "response";
-  int is_null;
-
-  gstc_mutex_lock (&(data->mutex));
-  data->waiting = 0;
-  data->message = (char *) malloc (msglen);
-  memcpy (data->message, message, msglen);
+  GstcThreadData *data;
+  GstcThread thread;
+  GstcStatus ret;
 
-  /* If a valid string was received, a valid bus message was received.
-     Otherwise, a timeout occurred */
-  ret = gstc_json_is_null (message, response_tag, &is_null);
-  if (GSTC_OK == ret) {
-    data->ret = is_null ? GSTC_BUS_TIMEOUT : ret;
-  } else {
-    data->ret = ret;
+  ret = gstc_cmd_bus_arm (client, pipeline_name, message_name, timeout);
+  if (GSTC_OK != ret) {
+    return ret;
   }
 
-  gstc_cond_signal (&(data->cond));
-  gstc_mutex_unlock (&(data->mutex));
+  data = malloc (sizeof (GstcThreadData));
+  data->client = client;
+  data->pipeline_name = pipeline_name;
+  data->message = message_name;
+  data->func = callback;
+  data->user_data = user_data;
+  data->timeout = timeout;
 
-  return GSTC_OK;
+  return gstc_thread_new (&thread, gstc_bus_thread, data);
 }
 
-#pragma GCC diagnostic pop
-
 GstcStatus
 gstc_pipeline_bus_wait (GstClient * client,
     const char *pipeline_name, const char *message_name,
     const long long timeout, char **message)
 {
-  GstcSyncBusData data;
   GstcStatus ret;
+  int asprintf_ret;
+  char *where;
+  const char *response_tag = "response";
+  int is_null;
 
-  gstc_cond_init (&(data.cond));
-  gstc_mutex_init (&(data.mutex));
-  data.waiting = 1;
+  gstc_assert_and_ret_val (NULL != client, GSTC_NULL_ARGUMENT);
+  gstc_assert_and_ret_val (NULL != pipeline_name, GSTC_NULL_ARGUMENT);
+  gstc_assert_and_ret_val (NULL != message_name, GSTC_NULL_ARGUMENT);
+  gstc_assert_and_ret_val (NULL != message, GSTC_NULL_ARGUMENT);
 
-  ret = gstc_pipeline_bus_wait_async (client, pipeline_name, message_name,
-      timeout, gstc_pipeline_bus_wait_callback, &data);
+  ret = gstc_cmd_bus_arm (client, pipeline_name, message_name, timeout);
   if (GSTC_OK != ret) {
     return ret;
   }
 
-  gstc_mutex_lock (&(data.mutex));
-  while (1 == data.waiting) {
-    gstc_cond_wait (&(data.cond), &(data.mutex));
+  asprintf_ret = asprintf (&where, PIPELINE_BUS_MSG_FORMAT, pipeline_name);
+  if (asprintf_ret == PRINTF_ERROR) {
+    return GSTC_OOM;
+  }
+
+  /* The caller already blocks for the message, read it on this thread.
+     -1 gives the socket an unlimited timeout, the daemon enforces the
+     bus timeout */
+  ret = gstc_cmd_read (client, where, message, -1);
+  free (where);
+  if (GSTC_OK != ret) {
+    return ret;
   }
-  gstc_mutex_unlock (&(data.mutex));
 
-  /* Output the message back to the user */
-  *message = data.message;
+  /* If a valid string was received, a valid bus message was received.
+     Otherwise, a timeout occurred */
+  ret = gstc_json_is_null (*message, response_tag, &is_null);
+  if (GSTC_OK == ret && is_null) {
+    return GSTC_BUS_TIMEOUT;
+  }
 
-  return data.ret;
+  return ret;
 }
 
 GstcStatus
 gstc_pipeline_list (GstClient * client, char **pipelines[], int *list_lenght)
 {
   GstcStatus ret;
-  char *response;
+  char *response = NULL;
 
   gstc_assert_and_ret_val (NULL != client, GSTC_NULL_ARGUMENT);
   gstc_assert_and_ret_val (NULL != list_lenght, GSTC_NULL_ARGUMENT);
   gstc_assert_and_ret_val (NULL != pipelines, GSTC_NULL_ARGUMENT);
 
-  ret = gstc_cmd_read (client, "/pipelines", &response, client->timeout);
+  /* A cached response can answer the query locally, the caller still
+     gets freshly allocated copies */
+  gstc_mutex_lock (&(client->cache_mutex));
+  if (client->use_read_cache && NULL != client->pipelines_cache) {
+    ret = gstc_json_get_child_char_array (client->pipelines_cache,
+        "response", "nodes", "name", pipelines, list_lenght);
+    gstc_mutex_unlock (&(client->cache_mutex));
+    return ret;
+  }
+  gstc_mutex_unlock (&(client->cache_mutex));
+
+  /* The request is always the same, skip formatting it on every call */
+  ret = gstc_cmd_send_get_response (client, "read /pipelines", &response,
+      client->timeout);
   if (GSTC_OK != ret) {
+    /* The daemon may have answered with an error code, in which case
+       the response was still allocated */
+    free (response);
     goto out;
   }
 
   ret = gstc_json_get_child_char_array (response, "response", "nodes",
       "name", pipelines, list_lenght);
 
+  /* Only well-formed responses are worth replaying, a corrupt one
+     should be refetched on the next call. A concurrent fetch may have
+     filled the cache meanwhile, keep the existing entry in that case */
+  gstc_mutex_lock (&(client->cache_mutex));
+  if (GSTC_OK == ret && client->use_read_cache
+      && NULL == client->pipelines_cache) {
+    client->pipelines_cache = response;
+  } else {
+    free (response);
+  }
+  gstc_mutex_unlock (&(client->cache_mutex));
+
 out:
   return ret;
 }
+
+GstcStatus
+gstc_pipeline_get_count (GstClient * client, int *count)
+{
+  GstcStatus ret;
+  char **pipelines;
+  int i;
+
+  gstc_assert_and_ret_val (NULL != client, GSTC_NULL_ARGUMENT);
+  gstc_assert_and_ret_val (NULL != count, GSTC_NULL_ARGUMENT);
+
+  ret = gstc_pipeline_list (client, &pipelines, count);
+  if (GSTC_OK != ret) {
+    return ret;
+  }
+
+  /* Only the length is of interest, drop the copies */
+  for (i = 0; i < *count; i++) {
+    free (pipelines[i]);
+  }
+  free (pipelines);
+
+  return GSTC_OK;
+}
@@ -129,7 +129,10 @@ typedef struct _GstClient GstClient;
 
 /**
  * gstc_client_new:
- * @address: The address to bind to
+ * @address: The address to bind to.  An address starting with '/' is
+ * taken as the path of the daemon's Unix socket, which avoids the TCP
+ * stack entirely when the daemon runs on the same host; @port is
+ * ignored in that case.
  * @port: The port to bind to
  * @wait_time: time to wait in milliseconds for a response from the daemon
  * before returning an error, applies to all non-blocking gstc_* methods.
@@ -172,6 +175,106 @@ gstc_client_free (GstClient *client);
  */
 GstcStatus gstc_client_ping(GstClient *client);
 
+/**
+ * gstc_client_enable_read_cache:
+ * @client: The client returned by gstc_client_new()
+ * @enable: Non-zero to enable the cache, zero to disable it
+ *
+ * Enables or disables the client side read cache. With the cache
+ * enabled, repeated queries such as gstc_pipeline_list() are answered
+ * from the last response without a round trip to the daemon. Mutating
+ * calls made through this client invalidate the cache, but changes
+ * made by other clients will not be observed until the cache is
+ * invalidated or disabled. The cache is disabled by default.
+ *
+ * Returns: GstcStatus indicating success, null argument
+ */
+GstcStatus gstc_client_enable_read_cache (GstClient *client,
+    const int enable);
+
+/**
+ * gstc_client_batch:
+ * @client: The client returned by gstc_client_new()
+ * @requests: Array of raw requests in the low level protocol syntax,
+ * i.e.: "update /pipelines/pipe/state playing"
+ * @num_requests: Number of requests in the array
+ * @codes: Array of at least @num_requests entries filled with the
+ * status of each individual request
+ *
+ * Sends a group of requests back to back over the single connection.
+ * Each request completes its own round trip before the next one is
+ * sent; the batch saves the per-call connection and formatting
+ * overhead, not the round-trip latency.  The requests are sent in
+ * order and every entry in @codes is filled, even after a failure.
+ *
+ * Returns: GstcStatus indicating success, or the status of the first
+ * request that failed
+ */
+GstcStatus gstc_client_batch (GstClient *client, const char *requests[],
+    const int num_requests, GstcStatus codes[]);
+
+/**
+ * gstc_client_batch_full:
+ * @client: The client returned by gstc_client_new()
+ * @requests: Array of raw requests in the low level protocol syntax,
+ * i.e.: "read /pipelines"
+ * @num_requests: Number of requests in the array
+ * @codes: Array of at least @num_requests entries filled with the
+ * status of each individual request
+ * @responses: Array of at least @num_requests entries filled with the
+ * raw response of each request, or NULL when the request could not be
+ * sent. Free each entry after usage.
+ *
+ * Same as gstc_client_batch(), but hands the raw responses back to the
+ * caller so read requests can be part of a batch.
+ *
+ * Returns: GstcStatus indicating success, or the status of the first
+ * request that failed
+ */
+GstcStatus gstc_client_batch_full (GstClient *client, const char *requests[],
+    const int num_requests, GstcStatus codes[], char *responses[]);
+
+/**
+ * GstcBatchCallback:
+ * @client: The client returned by gstc_client_new()
+ * @requests: The array of requests given to gstc_client_batch_async()
+ * @num_requests: Number of requests in the array
+ * @codes: The per-request status array, fully filled in
+ * @status: Overall status of the batch, the status of the first
+ * request that failed or success
+ * @user_data: (allow none): A placeholder for custom data
+ *
+ * The callback signature of the function to be registered in
+ * gstc_client_batch_async().
+ *
+ * Returns: GstcStatus indicating success or the callback's own error
+ */
+typedef GstcStatus
+(*GstcBatchCallback) (GstClient *client, const char *requests[],
+    const int num_requests, GstcStatus codes[], GstcStatus status,
+    void *user_data);
+
+/**
+ * gstc_client_batch_async:
+ * @client: The client returned by gstc_client_new()
+ * @requests: Array of raw requests in the low level protocol syntax
+ * @num_requests: Number of requests in the array
+ * @codes: Array of at least @num_requests entries filled with the
+ * status of each individual request
+ * @callback: The function to be called once the batch completes
+ * @user_data: (allow none): A placeholder for custom data
+ *
+ * Sends a group of requests from a helper thread so the caller can
+ * overlap control traffic with other work.  @requests and @codes must
+ * remain valid until @callback is invoked.
+ *
+ * Returns: GstcStatus indicating success, thread error or out of
+ * memory
+ */
+GstcStatus gstc_client_batch_async (GstClient *client, const char *requests[],
+    const int num_requests, GstcStatus codes[], GstcBatchCallback callback,
+    void *user_data);
+
 /**
  * gstc_client_debug:
  * @client: The client returned by gstc_client_new()
@@ -222,6 +325,21 @@ gstc_pipeline_create (GstClient *client, const char *pipeline_name,
 GstcStatus gstc_pipeline_list(GstClient *client, char **pipelines[],
   int *list_lenght);
 
+/**
+ * gstc_pipeline_get_count:
+ * @client: The client returned by gstc_client_new()
+ * @count: Number of existing pipelines
+ *
+ * Returns the number of existing pipelines without handing the names
+ * back to the caller. Convenient for callers that only compare
+ * lengths, and pairs well with the read cache enabled through
+ * gstc_client_enable_read_cache().
+ *
+ * Returns: GstcStatus indicating success, daemon unreachable, daemon
+ * timeout, out of memory
+ */
+GstcStatus gstc_pipeline_get_count (GstClient *client, int *count);
+
 /**
  * gstc_pipeline_delete:
  * @client: The client returned by gstc_client_new()
@@ -274,6 +392,20 @@ gstc_pipeline_pause(GstClient *client, const char *pipeline_name);
 GstcStatus
 gstc_pipeline_stop(GstClient *client, const char *pipeline_name);
 
+/**
+ * gstc_pipeline_teardown:
+ * @client: The client returned by gstc_client_new()
+ * @pipeline_name: Name assoicated with the pipeline
+ *
+ * Stops the named pipeline and deletes it in a single call, the usual
+ * sequence when a pipeline is no longer needed.
+ *
+ * Returns: GstcStatus indicating success, daemon unreachable, daemon
+ * timeout, bad pipeline name, unable to change pipeline state
+ */
+GstcStatus
+gstc_pipeline_teardown(GstClient *client, const char *pipeline_name);
+
 /**
  * gstc_element_get:
  * @client: The client returned by gstc_client_new()
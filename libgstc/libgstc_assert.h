@@ -50,16 +50,24 @@ extern "C"
 #define gstc_assert(cond)
 #else
 
+/* Only call into _gstc_assert when the check actually fails, so the
+   passing (common) case costs a single branch */
 #define gstc_assert_and_ret(cond)					\
-  _gstc_assert ((cond), #cond, __FILE__, __FUNCTION__, __LINE__);	\
-  if (!(cond)) return
+  if (!(cond)) {							\
+    _gstc_assert (0, #cond, __FILE__, __FUNCTION__, __LINE__);		\
+    return;								\
+  }
 
 #define gstc_assert_and_ret_val(cond, val)				\
-  _gstc_assert ((cond), #cond, __FILE__, __FUNCTION__, __LINE__);	\
-  if (!(cond)) return (val)
+  if (!(cond)) {							\
+    _gstc_assert (0, #cond, __FILE__, __FUNCTION__, __LINE__);		\
+    return (val);							\
+  }
 
 #define gstc_assert(cond)						\
-  _gstc_assert ((cond), #cond, __FILE__, __FUNCTION__, __LINE__)
+  if (!(cond)) {							\
+    _gstc_assert (0, #cond, __FILE__, __FUNCTION__, __LINE__);		\
+  }
 
 void
 _gstc_assert (int cond, const char *scond, const char *file,
@@ -31,6 +31,7 @@
  */
 
 #include <jansson.h>
+#include <stdio.h>
 #include <stdlib.h>
 #include <string.h>
 
@@ -39,6 +40,123 @@
 
 static GstcStatus gstc_json_get_value (const char *json, const char *name,
     json_t ** root, json_t ** out);
+static int gstc_json_scan_int (const char *json, const char *name, int *out);
+static int gstc_json_scan_null (const char *json, const char *name, int *out);
+
+/*
+ * Fast path for the very common "extract the code field" case: scan
+ * the document for the quoted key and parse the integer in place,
+ * skipping the full jansson parse. Returns non-zero only when the key
+ * occurs exactly once and is unambiguously followed by an integer;
+ * any other shape falls back to the parser so error reporting is
+ * unchanged.
+ */
+static int
+gstc_json_scan_int (const char *json, const char *name, int *out)
+{
+  char key[64];
+  const char *cur;
+  int key_len;
+  int sign = 1;
+  long value = 0;
+  int digits = 0;
+
+  key_len = snprintf (key, sizeof (key), "\"%s\"", name);
+  if (key_len <= 0 || (size_t) key_len >= sizeof (key)) {
+    return 0;
+  }
+
+  cur = strstr (json, key);
+  if (NULL == cur || NULL != strstr (cur + 1, key)) {
+    return 0;
+  }
+
+  cur += key_len;
+  while (' ' == *cur || '\t' == *cur || '\n' == *cur || '\r' == *cur) {
+    cur++;
+  }
+  if (':' != *cur) {
+    return 0;
+  }
+  cur++;
+  while (' ' == *cur || '\t' == *cur || '\n' == *cur || '\r' == *cur) {
+    cur++;
+  }
+
+  if ('-' == *cur) {
+    sign = -1;
+    cur++;
+  }
+  while (*cur >= '0' && *cur <= '9') {
+    value = value * 10 + (*cur - '0');
+    digits++;
+    cur++;
+  }
+  if (0 == digits || digits > 9) {
+    return 0;
+  }
+  while (' ' == *cur || '\t' == *cur || '\n' == *cur || '\r' == *cur) {
+    cur++;
+  }
+  if (',' != *cur && '}' != *cur) {
+    return 0;
+  }
+
+  *out = (int) (sign * value);
+  return 1;
+}
+
+/*
+ * Fast path for gstc_json_is_null(), used on every bus message to tell
+ * timeouts apart from real messages. Only the positive case is decided
+ * here: a unique key unambiguously holding the null literal. A non-null
+ * value still needs jansson to confirm the document is well formed, so
+ * everything else falls back. Returns non-zero when the fast path
+ * answered.
+ */
+static int
+gstc_json_scan_null (const char *json, const char *name, int *out)
+{
+  char key[64];
+  const char *cur;
+  int key_len;
+
+  key_len = snprintf (key, sizeof (key), "\"%s\"", name);
+  if (key_len <= 0 || (size_t) key_len >= sizeof (key)) {
+    return 0;
+  }
+
+  cur = strstr (json, key);
+  if (NULL == cur || NULL != strstr (cur + 1, key)) {
+    return 0;
+  }
+
+  cur += key_len;
+  while (' ' == *cur || '\t' == *cur || '\n' == *cur || '\r' == *cur) {
+    cur++;
+  }
+  if (':' != *cur) {
+    return 0;
+  }
+  cur++;
+  while (' ' == *cur || '\t' == *cur || '\n' == *cur || '\r' == *cur) {
+    cur++;
+  }
+
+  if (0 != strncmp (cur, "null", 4)) {
+    return 0;
+  }
+  cur += 4;
+  while (' ' == *cur || '\t' == *cur || '\n' == *cur || '\r' == *cur) {
+    cur++;
+  }
+  if (',' != *cur && '}' != *cur) {
+    return 0;
+  }
+
+  *out = 1;
+  return 1;
+}
 
 static GstcStatus
 gstc_json_get_value (const char *json, const char *name, json_t ** root,
@@ -79,6 +197,10 @@ gstc_json_get_int (const char *json, const char *name, int *out)
   gstc_assert_and_ret_val (name != NULL, GSTC_NULL_ARGUMENT);
   gstc_assert_and_ret_val (out != NULL, GSTC_NULL_ARGUMENT);
 
+  if (gstc_json_scan_int (json, name, out)) {
+    return GSTC_OK;
+  }
+
   ret = gstc_json_get_value (json, name, &root, &data);
   if (GSTC_OK != ret) {
     goto out;
@@ -110,6 +232,10 @@ gstc_json_is_null (const char *json, const char *name, int *out)
   gstc_assert_and_ret_val (name != NULL, GSTC_NULL_ARGUMENT);
   gstc_assert_and_ret_val (out != NULL, GSTC_NULL_ARGUMENT);
 
+  if (gstc_json_scan_null (json, name, out)) {
+    return GSTC_OK;
+  }
+
   ret = gstc_json_get_value (json, name, &root, &data);
   if (GSTC_OK != ret) {
     goto out;
@@ -164,6 +290,7 @@ gstc_json_get_child_char_array (const char *json, const char *parent_name,
 
   for (i = 0; i < (*array_lenght); i++) {
     const char *string;
+    size_t string_len;
 
     data = json_array_get (array_data, i);
     if (!json_is_object (data)) {
@@ -183,10 +310,9 @@ gstc_json_get_child_char_array (const char *json, const char *parent_name,
       * Jansson library frees memory after parent object is dereferenced,
       * memory copies are necessary in order to preserve data
       */
-    (*out)[i] = malloc (strlen (string) + 1);
-    strncpy ((*out)[i], string, strlen (string));
-    /* Ensure traling null byte is copied */
-    (*out)[i][strlen (string)] = '\0';
+    string_len = strlen (string);
+    (*out)[i] = malloc (string_len + 1);
+    memcpy ((*out)[i], string, string_len + 1);
   }
 
 unref:
@@ -214,12 +340,13 @@ gstc_json_child_string (const char *json, const char *parent_name,
   json_t *parent;
   json_t *data;
   const char *tmp_string;
-  
+  size_t tmp_string_len;
+
   gstc_assert_and_ret_val (json != NULL, GSTC_NULL_ARGUMENT);
   gstc_assert_and_ret_val (parent_name != NULL, GSTC_NULL_ARGUMENT);
   gstc_assert_and_ret_val (data_name != NULL, GSTC_NULL_ARGUMENT);
   gstc_assert_and_ret_val (out != NULL, GSTC_NULL_ARGUMENT);
-  
+
   ret = gstc_json_get_value (json, parent_name, &root, &parent);
   if (GSTC_OK != ret) {
     goto out;
@@ -237,11 +364,10 @@ gstc_json_child_string (const char *json, const char *parent_name,
   }
   
   tmp_string = json_string_value (data);
+  tmp_string_len = strlen (tmp_string);
   /* Allocate memory for output */
-  *out = malloc ((strlen (tmp_string) + 1) * sizeof (char));
-  strncpy (*out, tmp_string, strlen (tmp_string));
-  /* Ensure traling null byte is copied */
-  (*out)[strlen (tmp_string)] = '\0';
+  *out = malloc (tmp_string_len + 1);
+  memcpy (*out, tmp_string, tmp_string_len + 1);
   ret = GSTC_OK;
   
 unref:
@@ -31,23 +31,47 @@
  */
 
 #include <arpa/inet.h>
+#include <errno.h>
+#include <fcntl.h>
+#include <netinet/tcp.h>
 #include <poll.h>
 #include <stdlib.h>
 #include <string.h>
 #include <sys/socket.h>
+#include <sys/un.h>
 #include <unistd.h>
 
 #include "libgstc_assert.h"
 #include "libgstc_socket.h"
+#include "libgstc_thread.h"
 
 /* Allow the user to override this value at build time */
 #ifndef GSTC_MAX_RESPONSE_LENGTH
 #  define GSTC_MAX_RESPONSE_LENGTH 4096
 #endif
 
+/* Milliseconds to wait for the connection to be established before
+   reporting the daemon as unreachable. Overridable at build time */
+#ifndef GSTC_SOCKET_CONNECT_TIMEOUT
+#  define GSTC_SOCKET_CONNECT_TIMEOUT 1000
+#endif
+
+/* Socket buffer size sized for bursts of JSON command traffic, the
+   system defaults can be as small as a few commands. Overridable at
+   build time */
+#ifndef GSTC_SOCKET_BUFFER_SIZE
+#  define GSTC_SOCKET_BUFFER_SIZE (256 * 1024)
+#endif
+
+/* Milliseconds unacknowledged data may be pending before the kernel
+   declares the connection dead. Overridable at build time */
+#ifndef GSTC_SOCKET_USER_TIMEOUT
+#  define GSTC_SOCKET_USER_TIMEOUT 30000
+#endif
+
 #define NUMBER_OF_SOCKETS (1)
 
-static int create_new_socket ();
+static int create_new_socket (int domain);
 static GstcStatus open_socket(GstcSocket *self);
 
 struct _GstcSocket
@@ -55,12 +79,19 @@ struct _GstcSocket
   int socket;
   struct sockaddr_in server;
   int keep_connection_open;
+
+  /* Serializes concurrent senders so their request/response pairs
+     don't interleave on the shared connection */
+  GstcMutex mutex;
+
+  /* AF_INET or AF_UNIX, chosen from the shape of the address */
+  int domain;
+  struct sockaddr_un server_un;
 };
 
 static int
-create_new_socket (void)
+create_new_socket (int domain)
 {
-  const int domain = AF_INET;
   const int type = SOCK_STREAM;
   const int proto = 0;
 
@@ -70,19 +101,84 @@ create_new_socket (void)
 static GstcStatus
 open_socket(GstcSocket *self)
 {
+  const int flag = 1;
+  struct pollfd ufd;
+  int flags;
+  int error = 0;
+  socklen_t error_len = sizeof (error);
+
+  struct sockaddr *addr;
+  socklen_t addr_len;
+
   gstc_assert_and_ret_val (NULL != self, GSTC_NULL_ARGUMENT);
 
-  self->socket = create_new_socket ();
+  self->socket = create_new_socket (self->domain);
   if (-1 == self->socket) {
     return GSTC_SOCKET_ERROR;
   }
 
-  if (connect (self->socket, (struct sockaddr *) &self->server,
-          sizeof (self->server)) < 0) {
-    close (self->socket);
-    return GSTC_UNREACHABLE;
+  if (AF_UNIX == self->domain) {
+    addr = (struct sockaddr *) &self->server_un;
+    addr_len = sizeof (self->server_un);
+  } else {
+    addr = (struct sockaddr *) &self->server;
+    addr_len = sizeof (self->server);
   }
+
+  /* Connect in non-blocking mode so an absent daemon is reported
+     after a bounded timeout instead of the system's default, which
+     may stall the caller for minutes */
+  flags = fcntl (self->socket, F_GETFL, 0);
+  fcntl (self->socket, F_SETFL, flags | O_NONBLOCK);
+
+  if (connect (self->socket, addr, addr_len) < 0) {
+    if (EINPROGRESS != errno) {
+      goto unreachable;
+    }
+
+    ufd.fd = self->socket;
+    ufd.events = POLLOUT;
+    if (poll (&ufd, 1, GSTC_SOCKET_CONNECT_TIMEOUT) <= 0) {
+      goto unreachable;
+    }
+
+    if (getsockopt (self->socket, SOL_SOCKET, SO_ERROR, &error,
+            &error_len) < 0 || 0 != error) {
+      goto unreachable;
+    }
+  }
+
+  fcntl (self->socket, F_SETFL, flags);
+
+  /* The requests are small and latency bound, send them right away
+     instead of waiting for the ACK of a previous one. Unix sockets
+     have no Nagle algorithm to disable */
+  if (AF_INET == self->domain) {
+    const int buffer_size = GSTC_SOCKET_BUFFER_SIZE;
+#ifdef TCP_USER_TIMEOUT
+    const int user_timeout = GSTC_SOCKET_USER_TIMEOUT;
+#endif
+
+    setsockopt (self->socket, IPPROTO_TCP, TCP_NODELAY, &flag, sizeof (flag));
+
+    /* Room for bursts of commands without stalling the sender */
+    setsockopt (self->socket, SOL_SOCKET, SO_SNDBUF, &buffer_size,
+        sizeof (buffer_size));
+    setsockopt (self->socket, SOL_SOCKET, SO_RCVBUF, &buffer_size,
+        sizeof (buffer_size));
+
+#ifdef TCP_USER_TIMEOUT
+    /* Bound how long a dead peer can hold up a sender */
+    setsockopt (self->socket, IPPROTO_TCP, TCP_USER_TIMEOUT, &user_timeout,
+        sizeof (user_timeout));
+#endif
+  }
+
   return GSTC_OK;
+
+unreachable:
+  close (self->socket);
+  return GSTC_UNREACHABLE;
 }
 
 GstcStatus
@@ -105,10 +201,25 @@ gstc_socket_new (const char *address, const unsigned int port,
   }
 
   self->keep_connection_open = keep_connection_open;
-  
-  self->server.sin_addr.s_addr = inet_addr (address);
-  self->server.sin_family = domain;
-  self->server.sin_port = htons (port);
+  gstc_mutex_init (&self->mutex);
+
+  if ('/' == address[0]) {
+    /* A filesystem path means a Unix socket, which skips the whole
+       TCP machinery when the daemon runs on the same host */
+    if (strlen (address) >= sizeof (self->server_un.sun_path)) {
+      ret = GSTC_SOCKET_ERROR;
+      goto free_self;
+    }
+    self->domain = AF_UNIX;
+    memset (&self->server_un, 0, sizeof (self->server_un));
+    self->server_un.sun_family = AF_UNIX;
+    strcpy (self->server_un.sun_path, address);
+  } else {
+    self->domain = domain;
+    self->server.sin_addr.s_addr = inet_addr (address);
+    self->server.sin_family = domain;
+    self->server.sin_port = htons (port);
+  }
 
   if (self->keep_connection_open) {
     ret = open_socket(self);
@@ -134,6 +245,8 @@ gstc_socket_send (GstcSocket * self, const char *request, char **response,
     const int timeout)
 {
   int rv;
+  ssize_t nbytes;
+  int retried = 0;
   struct pollfd ufds[NUMBER_OF_SOCKETS];
   GstcStatus ret;
 
@@ -141,50 +254,111 @@ gstc_socket_send (GstcSocket * self, const char *request, char **response,
   gstc_assert_and_ret_val (NULL != request, GSTC_NULL_ARGUMENT);
   gstc_assert_and_ret_val (NULL != response, GSTC_NULL_ARGUMENT);
 
+  gstc_mutex_lock (&self->mutex);
+
   if (!self->keep_connection_open) {
     ret = open_socket(self);
     if (ret != GSTC_OK) {
-      goto out;
+      goto unlock;
     }
   }
 
-  if (send (self->socket, request, strlen (request), 0) < 0) {
-    ret = GSTC_SEND_ERROR;
+  *response = malloc (GSTC_MAX_RESPONSE_LENGTH);
+  if (NULL == *response) {
+    ret = GSTC_OOM;
     goto out;
   }
 
-  *response = malloc (GSTC_MAX_RESPONSE_LENGTH);
+resend:
+  /* The terminator is part of the message framing, include it in the
+     same single write so the daemon never waits on a partial command */
+  if (send (self->socket, request, strlen (request) + 1, MSG_NOSIGNAL) < 0) {
+    if (!self->keep_connection_open || retried) {
+      ret = GSTC_SEND_ERROR;
+      goto free_response;
+    }
+
+    /* The daemon may have dropped an idle persistent connection,
+       transparently reconnect and retry the request once */
+    retried = 1;
+    close (self->socket);
+    ret = open_socket (self);
+    if (GSTC_OK != ret) {
+      goto free_response;
+    }
+    goto resend;
+  }
 
   ufds[0].fd = self->socket;
   ufds[0].events = POLLIN;
-  
+
   rv = poll (ufds, NUMBER_OF_SOCKETS, timeout);
 
   /* Error ocurred in poll */
   if (rv == -1) {
-    return GSTC_SOCKET_ERROR;
+    ret = GSTC_SOCKET_ERROR;
+    goto free_response;
   }
   /* Timeout ocurred */
   else if (rv == 0) {
-    return GSTC_SOCKET_TIMEOUT;
+    ret = GSTC_SOCKET_TIMEOUT;
+    goto free_response;
   } else {
     /* Check for events on the socket */
     if (ufds[0].revents & POLLIN) {
-      if (recv (self->socket, *response, GSTC_MAX_RESPONSE_LENGTH, 0) < 0) {
-        return GSTC_RECV_ERROR;
+      /* Leave room for the terminator in case the response is
+         truncated at the buffer size */
+      nbytes = recv (self->socket, *response, GSTC_MAX_RESPONSE_LENGTH - 1, 0);
+      if (nbytes < 0) {
+        ret = GSTC_RECV_ERROR;
+        goto free_response;
       }
+      if (0 == nbytes) {
+        /* The peer's FIN often surfaces only after a successful send,
+           reconnect and retry once just like the send path */
+        if (self->keep_connection_open && !retried) {
+          retried = 1;
+          close (self->socket);
+          ret = open_socket (self);
+          if (GSTC_OK != ret) {
+            goto free_response;
+          }
+          goto resend;
+        }
+        ret = GSTC_RECV_ERROR;
+        goto free_response;
+      }
+      (*response)[nbytes] = '\0';
+#ifdef TCP_QUICKACK
+      /* Linux clears quickack after every recv, re-arm it so the
+         server's next response isn't stalled by a delayed ACK */
+      if (AF_INET == self->domain) {
+        const int flag = 1;
+        setsockopt (self->socket, IPPROTO_TCP, TCP_QUICKACK, &flag,
+            sizeof (flag));
+      }
+#endif
     } else {
-      return GSTC_SOCKET_ERROR;
+      ret = GSTC_SOCKET_ERROR;
+      goto free_response;
     }
   }
 
   ret = GSTC_OK;
+  goto out;
+
+free_response:
+  free (*response);
+  *response = NULL;
 
 out:
   if (!self->keep_connection_open) {
     close (self->socket);
   }
 
+unlock:
+  gstc_mutex_unlock (&self->mutex);
+
   return ret;
 }
 
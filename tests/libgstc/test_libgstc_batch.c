@@ -0,0 +1,257 @@
+/*
+ * GStreamer Daemon - Gst Launch under steroids
+ * Copyright (c) 2015-2018 Ridgerun, LLC (http://www.ridgerun.com)
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program; if not, write to the Free Software
+ * Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA
+ */
+#include <gst/check/gstcheck.h>
+#include <string.h>
+
+#include "libgstc.h"
+#include "libgstc_socket.h"
+#include "libgstc_assert.h"
+#include "libgstc_json.h"
+
+/* Test Fixture */
+static GstClient *_client;
+static gchar _request[8][512];
+static gint _request_count;
+static gint _fail_at;
+
+static void
+setup (void)
+{
+  const gchar *address = "";
+  unsigned int port = 0;
+  unsigned long wait_time = 5;
+  int keep_connection_open = 0;
+
+  gstc_client_new (address, port, wait_time, keep_connection_open, &_client);
+  memset (_request, 0, sizeof (_request));
+  _request_count = 0;
+  _fail_at = -1;
+}
+
+static void
+teardown (void)
+{
+  gstc_client_free (_client);
+}
+
+/* Mock implementation of a socket */
+typedef struct _GstcSocket
+{
+} GstcSocket;
+
+GstcSocket _socket;
+
+GstcStatus
+gstc_socket_new (const char *address, const unsigned int port,
+    const int keep_connection_open, GstcSocket ** out)
+{
+  *out = &_socket;
+
+  return GSTC_OK;
+}
+
+void
+gstc_socket_free (GstcSocket * socket)
+{
+}
+
+GstcStatus
+gstc_socket_send (GstcSocket * socket, const gchar * request, gchar ** response,
+    const int timeout)
+{
+  *response = malloc (1);
+
+  memcpy (_request[_request_count], request, strlen (request));
+  _request_count++;
+
+  if (_fail_at == _request_count - 1) {
+    return GSTC_UNREACHABLE;
+  }
+
+  return GSTC_OK;
+}
+
+GstcStatus
+gstc_json_get_int (const gchar * json, const gchar * name, gint * out)
+{
+  return *out = GSTC_OK;
+}
+
+GstcStatus
+gstc_json_is_null (const gchar * json, const gchar * name, gint * out)
+{
+  *out = 0;
+  return GSTC_OK;
+}
+
+GstcStatus
+gstc_json_get_child_char_array (const char *json, const char *parent_name,
+    const char *array_name, const char *element_name, char **out[],
+    int *array_lenght)
+{
+  return GSTC_OK;
+}
+
+GstcStatus
+gstc_json_child_string (const char * json, const char * parent_name,
+  const char * data_name, char ** out)
+{
+  gstc_assert_and_ret_val (NULL != json, GSTC_NULL_ARGUMENT);
+  gstc_assert_and_ret_val (NULL != parent_name, GSTC_NULL_ARGUMENT);
+  gstc_assert_and_ret_val (NULL != data_name, GSTC_NULL_ARGUMENT);
+  gstc_assert_and_ret_val (NULL != out, GSTC_NULL_ARGUMENT);
+
+  return GSTC_OK;
+}
+
+GST_START_TEST (test_batch_success)
+{
+  GstcStatus ret;
+  const char *requests[] = { "read /pipelines",
+    "create /pipelines pipe fakesrc ! fakesink",
+    "update /pipelines/pipe/state playing"
+  };
+  GstcStatus codes[3];
+  int i;
+
+  ret = gstc_client_batch (_client, requests, 3, codes);
+  assert_equals_int (GSTC_OK, ret);
+
+  assert_equals_int (3, _request_count);
+  for (i = 0; i < 3; i++) {
+    assert_equals_string (requests[i], _request[i]);
+    assert_equals_int (GSTC_OK, codes[i]);
+  }
+}
+
+GST_END_TEST;
+
+GST_START_TEST (test_batch_continues_after_failure)
+{
+  GstcStatus ret;
+  const char *requests[] = { "read /pipelines",
+    "update /pipelines/pipe/state playing"
+  };
+  GstcStatus codes[2];
+
+  /* Make the first request fail */
+  _fail_at = 0;
+
+  ret = gstc_client_batch (_client, requests, 2, codes);
+  assert_equals_int (GSTC_UNREACHABLE, ret);
+
+  /* The remaining requests are still sent and reported individually */
+  assert_equals_int (2, _request_count);
+  assert_equals_int (GSTC_UNREACHABLE, codes[0]);
+  assert_equals_int (GSTC_OK, codes[1]);
+}
+
+GST_END_TEST;
+
+GST_START_TEST (test_batch_full_success)
+{
+  GstcStatus ret;
+  const char *requests[] = { "read /pipelines",
+    "read /pipelines/pipe/state"
+  };
+  GstcStatus codes[2];
+  char *responses[2];
+  int i;
+
+  ret = gstc_client_batch_full (_client, requests, 2, codes, responses);
+  assert_equals_int (GSTC_OK, ret);
+
+  assert_equals_int (2, _request_count);
+  for (i = 0; i < 2; i++) {
+    assert_equals_string (requests[i], _request[i]);
+    assert_equals_int (GSTC_OK, codes[i]);
+    fail_if (NULL == responses[i]);
+    free (responses[i]);
+  }
+}
+
+GST_END_TEST;
+
+GST_START_TEST (test_batch_full_null_responses)
+{
+  GstcStatus ret;
+  const char *requests[] = { "read /pipelines" };
+  GstcStatus codes[1];
+
+  ret = gstc_client_batch_full (_client, requests, 1, codes, NULL);
+  assert_equals_int (GSTC_NULL_ARGUMENT, ret);
+}
+
+GST_END_TEST;
+
+GST_START_TEST (test_batch_null_client)
+{
+  GstcStatus ret;
+  const char *requests[] = { "read /pipelines" };
+  GstcStatus codes[1];
+
+  ret = gstc_client_batch (NULL, requests, 1, codes);
+  assert_equals_int (GSTC_NULL_ARGUMENT, ret);
+}
+
+GST_END_TEST;
+
+GST_START_TEST (test_batch_null_requests)
+{
+  GstcStatus ret;
+  GstcStatus codes[1];
+
+  ret = gstc_client_batch (_client, NULL, 1, codes);
+  assert_equals_int (GSTC_NULL_ARGUMENT, ret);
+}
+
+GST_END_TEST;
+
+GST_START_TEST (test_batch_null_codes)
+{
+  GstcStatus ret;
+  const char *requests[] = { "read /pipelines" };
+
+  ret = gstc_client_batch (_client, requests, 1, NULL);
+  assert_equals_int (GSTC_NULL_ARGUMENT, ret);
+}
+
+GST_END_TEST;
+
+static Suite *
+libgstc_batch_suite (void)
+{
+  Suite *suite = suite_create ("libgstc_batch");
+  TCase *tc = tcase_create ("general");
+
+  suite_add_tcase (suite, tc);
+
+  tcase_add_checked_fixture (tc, setup, teardown);
+  tcase_add_test (tc, test_batch_success);
+  tcase_add_test (tc, test_batch_continues_after_failure);
+  tcase_add_test (tc, test_batch_full_success);
+  tcase_add_test (tc, test_batch_full_null_responses);
+  tcase_add_test (tc, test_batch_null_client);
+  tcase_add_test (tc, test_batch_null_requests);
+  tcase_add_test (tc, test_batch_null_codes);
+
+  return suite;
+}
+
+GST_CHECK_MAIN (libgstc_batch);
@@ -29,8 +29,10 @@ static GstClient *_client;
 static gboolean _reachable;
 static guint64 _proc_time;
 
+/* The client is stateless across cases, build it once for the whole
+   test case rather than once per test */
 static void
-setup (void)
+suite_setup (void)
 {
   const gchar *address = "";
   unsigned int port = 0;
@@ -38,16 +40,21 @@ setup (void)
   int keep_connection_open = 0;
 
   gstc_client_new (address, port, wait_time, keep_connection_open, &_client);
-  _reachable = TRUE;
-  _proc_time = 0;
 }
 
 static void
-teardown (void)
+suite_teardown (void)
 {
   gstc_client_free (_client);
 }
 
+static void
+setup (void)
+{
+  _reachable = TRUE;
+  _proc_time = 0;
+}
+
 /* Mock implementation of a socket */
 typedef struct _GstcSocket
 {
@@ -177,7 +184,8 @@ libgstc_ping_suite (void)
 
   suite_add_tcase (suite, tc);
 
-  tcase_add_checked_fixture (tc, setup, teardown);
+  tcase_add_unchecked_fixture (tc, suite_setup, suite_teardown);
+  tcase_add_checked_fixture (tc, setup, NULL);
   tcase_add_test (tc, test_ping_success);
   tcase_add_test (tc, test_ping_null_client);
   tcase_add_test (tc, test_ping_unreachable);
@@ -26,6 +26,7 @@
 
 /* Test Fixture */
 static gchar _request[512];
+static int _send_count;
 static GstClient *_client;
 
 static void
@@ -36,6 +37,7 @@ setup (void)
   unsigned long wait_time = 5;
   int keep_connection_open = 0;
 
+  _send_count = 0;
   gstc_client_new (address, port, wait_time, keep_connection_open, &_client);
 }
 
@@ -79,6 +81,7 @@ gstc_socket_send (GstcSocket *socket, const char *request,
   *response = malloc (1);
 
   memcpy (_request, request, strlen (request));
+  _send_count++;
 
   return GSTC_OK;
 }
@@ -114,7 +117,10 @@ gstc_json_get_child_char_array(const char *json, const char* parent_name,
   gstc_assert_and_ret_val (NULL != element_name, GSTC_NULL_ARGUMENT);
   gstc_assert_and_ret_val (NULL != out, GSTC_NULL_ARGUMENT);
   gstc_assert_and_ret_val (NULL != array_lenght, GSTC_NULL_ARGUMENT);
-    
+
+  *out = NULL;
+  *array_lenght = 0;
+
   return GSTC_OK;
 }
 
@@ -146,6 +152,70 @@ GST_START_TEST (test_pipeline_list_success)
 
 GST_END_TEST;
 
+GST_START_TEST (test_pipeline_list_read_cache)
+{
+  GstcStatus ret;
+  char **response;
+  int array_lenght;
+
+  ret = gstc_client_enable_read_cache (_client, 1);
+  assert_equals_int (GSTC_OK, ret);
+
+  ret = gstc_pipeline_list (_client, &response, &array_lenght);
+  assert_equals_int (GSTC_OK, ret);
+
+  /* The second listing is answered from the cache */
+  ret = gstc_pipeline_list (_client, &response, &array_lenght);
+  assert_equals_int (GSTC_OK, ret);
+  assert_equals_int (1, _send_count);
+
+  /* A mutating call invalidates the cache */
+  ret = gstc_pipeline_delete (_client, "p0");
+  assert_equals_int (GSTC_OK, ret);
+
+  ret = gstc_pipeline_list (_client, &response, &array_lenght);
+  assert_equals_int (GSTC_OK, ret);
+  assert_equals_int (3, _send_count);
+}
+
+GST_END_TEST;
+
+GST_START_TEST (test_pipeline_get_count_success)
+{
+  GstcStatus ret;
+  const gchar *expected = "read /pipelines";
+  int count = -1;
+
+  ret = gstc_pipeline_get_count (_client, &count);
+
+  assert_equals_int (GSTC_OK, ret);
+  assert_equals_int (0, count);
+  assert_equals_string (expected, _request);
+}
+
+GST_END_TEST;
+
+GST_START_TEST (test_pipeline_get_count_null_count)
+{
+  GstcStatus ret;
+
+  ret = gstc_pipeline_get_count (_client, NULL);
+  assert_equals_int (GSTC_NULL_ARGUMENT, ret);
+}
+
+GST_END_TEST;
+
+GST_START_TEST (test_pipeline_get_count_null_client)
+{
+  GstcStatus ret;
+  int count;
+
+  ret = gstc_pipeline_get_count (NULL, &count);
+  assert_equals_int (GSTC_NULL_ARGUMENT, ret);
+}
+
+GST_END_TEST;
+
 GST_START_TEST (test_pipeline_list_null_list_lenght)
 {
   GstcStatus ret;
@@ -192,6 +262,10 @@ libgstc_pipeline_list_suite (void)
 
   tcase_add_checked_fixture (tc, setup, teardown);
   tcase_add_test (tc, test_pipeline_list_success);
+  tcase_add_test (tc, test_pipeline_list_read_cache);
+  tcase_add_test (tc, test_pipeline_get_count_success);
+  tcase_add_test (tc, test_pipeline_get_count_null_count);
+  tcase_add_test (tc, test_pipeline_get_count_null_client);
   tcase_add_test (tc, test_pipeline_list_null_list_lenght);
   tcase_add_test (tc, test_pipeline_list_null_client);
   tcase_add_test (tc, test_pipeline_list_null_pipelines);
@@ -19,7 +19,10 @@
 #include <arpa/inet.h>
 #include <gst/check/gstcheck.h>
 #include <gio/gio.h>
+#include <gio/gunixsocketaddress.h>
+#include <glib/gstdio.h>
 #include <sys/socket.h>
+#include <unistd.h>
 
 #include "libgstc.h"
 #include "libgstc_socket.h"
@@ -36,6 +39,9 @@ struct _GstcSocket
 GMainLoop *_loop;
 GSocketService *_mock_server;
 GThread *_mock_thread;
+GMutex _loop_lock;
+GCond _loop_cond;
+gboolean _loop_running;
 const gchar *_mock_expected;
 long socket_delay;
 
@@ -80,14 +86,22 @@ mock_server_thread (gpointer data)
   return NULL;
 }
 
+static gboolean
+mock_server_running_cb (gpointer data)
+{
+  g_mutex_lock (&_loop_lock);
+  _loop_running = TRUE;
+  g_cond_signal (&_loop_cond);
+  g_mutex_unlock (&_loop_lock);
+
+  return G_SOURCE_REMOVE;
+}
+
 static void
 mock_server_new (void)
 {
   GError *error = NULL;
-  gint64 start_time;
-  gint64 start_timeout = 1000000;       /* 1s */
-  gint64 loop_wait_time = 5000;        /* 5ms */
-  gint64 time_passed = 0;
+  gint64 end_time;
 
   _mock_server = g_threaded_socket_service_new (-1);
   _mock_expected = NULL;
@@ -100,21 +114,23 @@ mock_server_new (void)
   g_socket_service_start (_mock_server);
 
   _loop = g_main_loop_new (NULL, FALSE);
-  _mock_thread = g_thread_new ("mock_server", mock_server_thread, NULL);
 
-  /* 
-   * FIXME this is done in order to ensure that the socket loop is running
-   * before starting the test and isn't dereferenced in an inconsistent state.
-   * This timeouts after 1s
+  /*
+   * The idle source fires once the loop is actually dispatching, so the
+   * test never touches the server in an inconsistent state. This
+   * timeouts after 1s
    */
-  start_time = g_get_monotonic_time ();
-  while (!g_main_loop_is_running (_loop) ) {
-    g_usleep (loop_wait_time);  /* Wait before checking again */
-      
-    /* Exit if timeout is reached */
-    time_passed = g_get_monotonic_time () - start_time;
-    g_return_if_fail(time_passed < start_timeout);
+  _loop_running = FALSE;
+  g_idle_add (mock_server_running_cb, NULL);
+
+  _mock_thread = g_thread_new ("mock_server", mock_server_thread, NULL);
+
+  g_mutex_lock (&_loop_lock);
+  end_time = g_get_monotonic_time () + G_TIME_SPAN_SECOND;
+  while (!_loop_running) {
+    fail_if (!g_cond_wait_until (&_loop_cond, &_loop_lock, end_time));
   }
+  g_mutex_unlock (&_loop_lock);
 }
 
 static void
@@ -323,6 +339,58 @@ GST_START_TEST (test_socket_persistent)
 
 GST_END_TEST;
 
+GST_START_TEST (test_socket_success_unix)
+{
+  GstcSocket *socket;
+  GstcStatus ret;
+  GSocketService *unix_server;
+  GSocketAddress *unix_address;
+  GError *error = NULL;
+  gchar *path;
+  const int timeout = -1;
+  const gint keep_open = TRUE;
+  const gchar *request = "ping";
+  const gchar *expected = "pong";
+  gchar *response;
+
+  /* A second mock daemon, this one behind a Unix socket */
+  path = g_strdup_printf ("%s/test_libgstc_socket_%d.sock", g_get_tmp_dir (),
+      getpid ());
+  g_unlink (path);
+
+  unix_server = g_threaded_socket_service_new (-1);
+  unix_address = g_unix_socket_address_new (path);
+  g_socket_listener_add_address ((GSocketListener *) unix_server, unix_address,
+      G_SOCKET_TYPE_STREAM, G_SOCKET_PROTOCOL_DEFAULT, NULL, NULL, &error);
+  fail_if (error);
+
+  g_signal_connect (unix_server, "run", G_CALLBACK (mock_server_cb), NULL);
+  g_socket_service_start (unix_server);
+
+  /* The path style address selects the Unix transport, the port is
+     ignored */
+  ret = gstc_socket_new (path, 0, keep_open, &socket);
+  assert_equals_int (GSTC_OK, ret);
+  fail_if (NULL == socket);
+
+  _mock_expected = expected;
+  ret = gstc_socket_send (socket, request, &response, timeout);
+
+  assert_equals_int (GSTC_OK, ret);
+  assert_equals_string (expected, response);
+
+  g_free (response);
+  gstc_socket_free (socket);
+
+  g_socket_service_stop (unix_server);
+  g_object_unref (unix_server);
+  g_object_unref (unix_address);
+  g_unlink (path);
+  g_free (path);
+}
+
+GST_END_TEST;
+
 GST_START_TEST (test_socket_oom)
 {
   GstcSocket *socket;
@@ -452,6 +520,7 @@ libgstc_client_suite (void)
   tcase_add_test (tc, test_socket_success_keep_open);
   tcase_add_test (tc, test_socket_success_keep_closed);
   tcase_add_test (tc, test_socket_persistent);
+  tcase_add_test (tc, test_socket_success_unix);
   tcase_add_test (tc, test_socket_oom);
   tcase_add_test (tc, test_socket_unreachable);
   tcase_add_test (tc, test_socket_null_address);